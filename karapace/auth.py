@@ -9,7 +9,7 @@ from hmac import compare_digest
 from karapace.config import InvalidConfiguration
 from karapace.rapu import JSON_CONTENT_TYPE
 from karapace.statsd import StatsClient
-from karapace.utils import json_decode, json_encode
+from karapace.utils import json_decode_stream, json_encode
 from typing import List, Optional
 from typing_extensions import TypedDict
 from watchfiles import awatch, Change
@@ -143,7 +143,7 @@ class HTTPAuthorizer:
         try:
             statinfo = os.stat(self._auth_filename)
             with open(self._auth_filename) as authfile:
-                authdata = json_decode(authfile, AuthData)
+                authdata = json_decode_stream(authfile, AuthData)
 
                 users = {
                     user["username"]: User(
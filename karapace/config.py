@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from enum import Enum, unique
 from karapace.constants import DEFAULT_SCHEMA_TOPIC
-from karapace.utils import json_decode, json_encode, JSONDecodeError
+from karapace.utils import json_decode_stream, json_encode, JSONDecodeError
 from pathlib import Path
 from typing import IO
 from typing_extensions import TypedDict
@@ -242,7 +242,7 @@ def write_config(config_path: Path, custom_values: Config) -> None:
 
 def read_config(config_handler: IO) -> Config:
     try:
-        config = json_decode(config_handler)
+        config = json_decode_stream(config_handler)
     except JSONDecodeError as ex:
         raise InvalidConfiguration("Configuration is not a valid JSON") from ex
 
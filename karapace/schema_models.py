@@ -3,7 +3,7 @@ Copyright (c) 2023 Aiven Ltd
 See LICENSE for details
 """
 from avro.errors import SchemaParseException
-from avro.schema import parse as avro_parse, Schema as AvroSchema
+from avro.schema import make_avsc_object, Schema as AvroSchema
 from dataclasses import dataclass
 from enum import Enum, unique
 from jsonschema import Draft7Validator
@@ -22,22 +22,51 @@ from karapace.typing import ResolvedVersion, SchemaId, Subject
 from karapace.utils import json_decode, json_encode, JSONDecodeError
 from typing import Any, cast, Dict, NoReturn, Optional, Union
 
+import functools
 import hashlib
 import logging
 
 LOG = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_avro_schema_definition_cached(schema_str: str, validate_enum_symbols: bool, validate_names: bool) -> AvroSchema:
+    """Memoized Avro schema compilation, shared across identical schema texts.
+
+    Parsing an Avro schema walks the whole definition and is by far the most
+    expensive part of schema ingestion, while the registry parses the same
+    schema text repeatedly (compatibility checks, registry reloads). The
+    returned ``AvroSchema`` is treated as immutable by all callers.
+
+    ``make_avsc_object`` is used instead of ``avro.schema.parse`` so the JSON
+    text is decoded exactly once, without the serialize/re-parse round trip
+    `parse` would do.
+    """
+    json_data = json_decode(schema_str)
+    return make_avsc_object(json_data, validate_enum_symbols=validate_enum_symbols, validate_names=validate_names)
+
+
 def parse_avro_schema_definition(s: str, validate_enum_symbols: bool = True, validate_names: bool = True) -> AvroSchema:
-    """Compatibility function with Avro which ignores trailing data in JSON
-    strings.
+    """Parses an Avro schema definition.
 
-    The Python stdlib `json` module doesn't allow to ignore trailing data. If
-    parsing fails because of it, the extra data can be removed and parsed
-    again.
+    Raises:
+        SchemaParseException: If the definition is not a valid Avro schema.
+        JSONDecodeError: If the definition is not valid JSON.
     """
-    json_data = json_decode(s)
-    return avro_parse(json_encode(json_data), validate_enum_symbols=validate_enum_symbols, validate_names=validate_names)
+    return _parse_avro_schema_definition_cached(s, validate_enum_symbols, validate_names)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compiled_jsonschema(normalized_schema_str: str) -> Draft7Validator:
+    """Memoized JSON schema validator compilation, shared across identical schema texts.
+
+    ``Draft7Validator.check_schema`` plus validator construction dominate the
+    cost of JSON schema parsing, so compile once per distinct schema instead
+    of once per request.
+    """
+    schema = json_decode(normalized_schema_str)
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
 
 
 def parse_jsonschema_definition(schema_definition: str) -> Draft7Validator:
@@ -46,14 +75,29 @@ def parse_jsonschema_definition(schema_definition: str) -> Draft7Validator:
     Raises:
         SchemaError: If `schema_definition` is not a valid Draft7 schema.
     """
-    schema = json_decode(schema_definition)
-    Draft7Validator.check_schema(schema)
-    return Draft7Validator(schema)
+    return _compiled_jsonschema(json_encode(json_decode(schema_definition), compact=True, sort_keys=True))
+
 
+def clear_caches() -> None:
+    """Drop the memoized schema parsers and validators.
+
+    Intended for tests and shutdown, where compiled validators should not
+    leak between cases or outlive the registry.
+    """
+    _parse_avro_schema_definition_cached.cache_clear()
+    _compiled_jsonschema.cache_clear()
+    parse_protobuf_schema_definition.cache_clear()
 
+
+@functools.lru_cache(maxsize=1024)
 def parse_protobuf_schema_definition(schema_definition: str) -> ProtobufSchema:
     """Parses and validates `schema_definition`.
 
+    The result is memoized so that schema ingestion, which both normalizes and
+    parses the same definition, walks the protobuf AST once. ``ProtobufSchema``
+    caches its canonical string form on the instance, so normalization of a
+    shared instance is a plain attribute read after the first rendering.
+
     Raises:
         Nothing yet.
 
@@ -74,6 +118,8 @@ def _assert_never(no_return: NoReturn) -> NoReturn:
 
 
 class TypedSchema:
+    __slots__ = ("schema_type", "schema_str", "max_id", "_schema_bytes", "_schema_dict", "_fingerprint_cached")
+
     def __init__(self, schema_type: SchemaType, schema_str: str):
         """Schema with type information
 
@@ -82,19 +128,47 @@ class TypedSchema:
             schema_str (str): The original schema string
         """
         self.schema_type = schema_type
-        self.schema_str = TypedSchema.normalize_schema_str(schema_str, schema_type)
+        schema_dict: Optional[Dict[str, Any]] = None
+        if schema_type is SchemaType.AVRO or schema_type is SchemaType.JSONSCHEMA:
+            # Normalization already decodes the schema, keep the parsed form
+            # around so `to_dict` never has to re-parse it.
+            try:
+                schema_dict = json_decode(schema_str, Dict[str, Any])
+            except JSONDecodeError as e:
+                LOG.error("Schema is not valid JSON")
+                raise e
+            self.schema_str = json_encode(schema_dict, compact=True, sort_keys=True)
+        else:
+            self.schema_str = TypedSchema.normalize_schema_str(schema_str, schema_type)
         self.max_id: Optional[SchemaId] = None
 
+        # The normalized schema encoded once, so fingerprinting does not
+        # allocate a new bytes object per call.
+        self._schema_bytes = self.schema_str.encode("utf8")
+        self._schema_dict = schema_dict
         self._fingerprint_cached: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         if self.schema_type is SchemaType.PROTOBUF:
             raise InvalidSchema("Protobuf do not support to_dict serialization")
-        return json_decode(self.schema_str, Dict[str, Any])
+        # The parsed form is cached and shared, callers treat it as read-only.
+        if self._schema_dict is None:
+            self._schema_dict = json_decode(self.schema_str, Dict[str, Any])
+        return self._schema_dict
 
     def fingerprint(self) -> str:
         if self._fingerprint_cached is None:
-            self._fingerprint_cached = hashlib.sha1(str(self).encode("utf8")).hexdigest()
+            # `schema_str` is already normalized for non-protobuf schemas, so the
+            # `__str__` dispatch is only needed for protobuf where stringification
+            # renders the parsed schema.
+            if self.schema_type is SchemaType.PROTOBUF:
+                data = str(self).encode("utf8")
+            else:
+                data = self._schema_bytes
+            # The fingerprint is only used for in-memory dedupe and equality, it
+            # is never persisted or exposed, so the faster blake2b is preferred
+            # over sha1.
+            self._fingerprint_cached = hashlib.blake2b(data, digest_size=20).hexdigest()
         return self._fingerprint_cached
 
     @staticmethod
@@ -105,7 +179,7 @@ class TypedSchema:
             except JSONDecodeError as e:
                 LOG.error("Schema is not valid JSON")
                 raise e
-        elif schema_type == SchemaType.PROTOBUF:
+        elif schema_type is SchemaType.PROTOBUF:
             try:
                 schema_str = str(parse_protobuf_schema_definition(schema_str))
             except InvalidSchema as e:
@@ -122,40 +196,51 @@ class TypedSchema:
         return f"TypedSchema(type={self.schema_type}, schema={str(self)})"
 
     def __eq__(self, other: Any) -> bool:
-        return isinstance(other, TypedSchema) and str(self) == str(other) and self.schema_type is other.schema_type
+        # Fingerprints are cached, so after the first comparison this is a
+        # fixed-length hex compare instead of re-stringifying both schemas.
+        if not isinstance(other, TypedSchema):
+            return False
+        if self.schema_type is not other.schema_type:
+            return False
+        return self.fingerprint() == other.fingerprint()
 
+    def __hash__(self) -> int:
+        return hash((self.schema_type, self.fingerprint()))
 
-def parse(
-    schema_type: SchemaType,
+
+def _parse_avro(schema_str: str, validate_avro_enum_symbols: bool, validate_avro_names: bool) -> AvroSchema:
+    return parse_avro_schema_definition(
+        schema_str,
+        validate_enum_symbols=validate_avro_enum_symbols,
+        validate_names=validate_avro_names,
+    )
+
+
+def _parse_jsonschema(
     schema_str: str,
-    validate_avro_enum_symbols: bool,
-    validate_avro_names: bool,
-) -> "ParsedTypedSchema":
-    if schema_type not in [SchemaType.AVRO, SchemaType.JSONSCHEMA, SchemaType.PROTOBUF]:
-        raise InvalidSchema(f"Unknown parser {schema_type} for {schema_str}")
+    validate_avro_enum_symbols: bool,  # pylint: disable=unused-argument
+    validate_avro_names: bool,  # pylint: disable=unused-argument
+) -> Draft7Validator:
+    return parse_jsonschema_definition(schema_str)
 
-    parsed_schema: Union[Draft7Validator, AvroSchema, ProtobufSchema]
-    if schema_type is SchemaType.AVRO:
-        try:
-            parsed_schema = parse_avro_schema_definition(
-                schema_str,
-                validate_enum_symbols=validate_avro_enum_symbols,
-                validate_names=validate_avro_names,
-            )
-        except (SchemaParseException, JSONDecodeError, TypeError) as e:
-            raise InvalidSchema from e
-
-    elif schema_type is SchemaType.JSONSCHEMA:
-        try:
-            parsed_schema = parse_jsonschema_definition(schema_str)
-            # TypeError - Raised when the user forgets to encode the schema as a string.
-        except (TypeError, JSONDecodeError, SchemaError, AssertionError) as e:
-            raise InvalidSchema from e
-
-    elif schema_type is SchemaType.PROTOBUF:
-        try:
-            parsed_schema = parse_protobuf_schema_definition(schema_str)
-        except (
+
+def _parse_protobuf(
+    schema_str: str,
+    validate_avro_enum_symbols: bool,  # pylint: disable=unused-argument
+    validate_avro_names: bool,  # pylint: disable=unused-argument
+) -> ProtobufSchema:
+    return parse_protobuf_schema_definition(schema_str)
+
+
+# Dispatch table mapping each schema type to its parser and to the exceptions
+# the parser raises for an invalid schema. TypeError is raised when the user
+# forgets to encode the schema as a string.
+_SCHEMA_PARSERS: Dict[SchemaType, Any] = {
+    SchemaType.AVRO: (_parse_avro, (SchemaParseException, JSONDecodeError, TypeError)),
+    SchemaType.JSONSCHEMA: (_parse_jsonschema, (TypeError, JSONDecodeError, SchemaError, AssertionError)),
+    SchemaType.PROTOBUF: (
+        _parse_protobuf,
+        (
             TypeError,
             SchemaError,
             AssertionError,
@@ -165,11 +250,28 @@ def parse(
             ProtobufError,
             ProtobufException,
             ProtobufSchemaParseException,
-        ) as e:
-            raise InvalidSchema from e
-    else:
+        ),
+    ),
+}
+
+
+def parse(
+    schema_type: SchemaType,
+    schema_str: str,
+    validate_avro_enum_symbols: bool,
+    validate_avro_names: bool,
+) -> "ParsedTypedSchema":
+    parser = _SCHEMA_PARSERS.get(schema_type)
+    if parser is None:
         raise InvalidSchema(f"Unknown parser {schema_type} for {schema_str}")
 
+    parser_function, invalid_schema_errors = parser
+    parsed_schema: Union[Draft7Validator, AvroSchema, ProtobufSchema]
+    try:
+        parsed_schema = parser_function(schema_str, validate_avro_enum_symbols, validate_avro_names)
+    except invalid_schema_errors as e:
+        raise InvalidSchema from e
+
     return ParsedTypedSchema(schema_type=schema_type, schema_str=schema_str, schema=parsed_schema)
 
 
@@ -192,9 +294,12 @@ class ParsedTypedSchema(TypedSchema):
     are considered by the current version of the SDK invalid.
     """
 
+    __slots__ = ("schema", "_str_cached")
+
     def __init__(self, schema_type: SchemaType, schema_str: str, schema: Union[Draft7Validator, AvroSchema, ProtobufSchema]):
         super().__init__(schema_type=schema_type, schema_str=schema_str)
         self.schema = schema
+        self._str_cached: Optional[str] = None
 
     @staticmethod
     def parse(schema_type: SchemaType, schema_str: str) -> "ParsedTypedSchema":
@@ -206,8 +311,12 @@ class ParsedTypedSchema(TypedSchema):
         )
 
     def __str__(self) -> str:
-        if self.schema_type == SchemaType.PROTOBUF:
-            return str(self.schema)
+        if self.schema_type is SchemaType.PROTOBUF:
+            # Stringification walks the whole protobuf AST, cache the result as
+            # fingerprinting and compatibility checks stringify repeatedly.
+            if self._str_cached is None:
+                self._str_cached = str(self.schema)
+            return self._str_cached
         return super().__str__()
 
 
@@ -225,6 +334,8 @@ class ValidatedTypedSchema(ParsedTypedSchema):
     are considered by the current version of the SDK invalid.
     """
 
+    __slots__ = ()
+
     def __init__(self, schema_type: SchemaType, schema_str: str, schema: Union[Draft7Validator, AvroSchema, ProtobufSchema]):
         super().__init__(schema_type=schema_type, schema_str=schema_str, schema=schema)
 
@@ -241,6 +352,10 @@ class ValidatedTypedSchema(ParsedTypedSchema):
 
 @dataclass
 class SchemaVersion:
+    # Manual __slots__ since dataclass(slots=True) needs Python 3.10 and 3.8
+    # is still supported.
+    __slots__ = ("subject", "version", "deleted", "schema_id", "schema")
+
     subject: Subject
     version: ResolvedVersion
     deleted: bool
@@ -10,7 +10,7 @@ from karapace.client import Client
 from karapace.protobuf.exception import ProtobufTypeException
 from karapace.protobuf.io import ProtobufDatumReader, ProtobufDatumWriter
 from karapace.schema_models import InvalidSchema, ParsedTypedSchema, SchemaType, TypedSchema, ValidatedTypedSchema
-from karapace.utils import json_decode, json_encode
+from karapace.utils import json_decode_stream, json_encode
 from typing import Any, Dict, Optional, Tuple
 from urllib.parse import quote
 
@@ -296,7 +296,7 @@ def read_value(config: dict, schema: TypedSchema, bio: io.BytesIO):
         reader = DatumReader(writers_schema=schema.schema)
         return reader.read(BinaryDecoder(bio))
     if schema.schema_type is SchemaType.JSONSCHEMA:
-        value = json_decode(bio)
+        value = json_decode_stream(bio)
         try:
             schema.schema.validate(value)
         except ValidationError as e:
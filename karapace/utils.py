@@ -21,20 +21,47 @@ from typing import AnyStr, cast, IO, Literal, NoReturn, overload, TypeVar
 import importlib
 import kafka.client_async
 import logging
+import re
 import time
 
-if importlib.util.find_spec("ujson"):
+# The fastest available backend is picked at import time. All backends emit
+# compact JSON by default, the stdlib `json` module is always used for the
+# pretty-printed (`indent`) output since the C backends only support a fixed
+# indent width.
+#
+# Accepted divergence: orjson emits non-ASCII text as raw UTF-8 while ujson
+# and the stdlib escape it (`"é"` vs `"\u00e9"`). Both decode to the same
+# data, but normalized schema strings stored in the schemas topic and returned
+# to clients change representation for schemas containing non-ASCII text.
+if importlib.util.find_spec("orjson"):
+    # The stdlib alias is used on purpose: orjson.JSONDecodeError subclasses
+    # it, so this also covers the stdlib fallback used for integer literals
+    # outside the 64-bit range.
+    from json import JSONDecodeError  # noqa: F401 pylint: disable=unused-import, useless-suppression
+
+    import orjson
+
+    JSON_BACKEND = "orjson"
+elif importlib.util.find_spec("ujson"):
     from ujson import JSONDecodeError  # noqa: F401 pylint: disable=unused-import, useless-suppression
 
-    import ujson as json
+    import ujson
+
+    JSON_BACKEND = "ujson"
 else:
     from json import JSONDecodeError  # noqa: F401 pylint: disable=unused-import, useless-suppression
 
-    import json
+    JSON_BACKEND = "json"
+
+import json
 
 NS_BLACKOUT_DURATION_SECONDS = 120
 LOG = logging.getLogger(__name__)
 
+# Pre-bound to skip the module attribute lookup in tight polling loops.
+_monotonic = time.monotonic
+_HTTP_INTERNAL_SERVER_ERROR = HTTPStatus.INTERNAL_SERVER_ERROR
+
 
 def _isoformat(datetime_obj: datetime) -> str:
     """Return datetime to ISO 8601 variant suitable for users.
@@ -82,6 +109,47 @@ def default_json_serialization(
     assert_never(f"Object of type {obj.__class__.__name__!r} is not JSON serializable")
 
 
+if JSON_BACKEND == "orjson":
+    # Datetimes are serialized natively at C speed instead of through the
+    # `default_json_serialization` callback. OPT_NAIVE_UTC and OPT_UTC_Z
+    # preserve the assume-UTC and Z-designator behaviour of `_isoformat` for
+    # naive and UTC-aware datetimes. Accepted divergence: aware datetimes with
+    # a non-UTC offset keep that offset instead of being converted to UTC with
+    # Z, both are ISO 8601 renderings of the same instant.
+    _orjson_base_option = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+    _orjson_sorted_option = _orjson_base_option | orjson.OPT_SORT_KEYS
+
+if JSON_BACKEND == "orjson":
+    # orjson parses integer literals outside the 64-bit range as lossy floats,
+    # which would silently corrupt e.g. a uint128 `maximum` bound in a JSON
+    # schema. Any input containing a digit run long enough to overflow (2**63-1
+    # has 19 digits) is decoded with the stdlib codec instead, which preserves
+    # arbitrary precision. The matching encode fallback lives in `json_encode`.
+    _LONG_DIGIT_RUN_STR = re.compile(r"[0-9]{19}")
+    _LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19}")
+
+    def _json_loads(content: AnyStr) -> JsonData:
+        pattern = _LONG_DIGIT_RUN_BYTES if type(content) is bytes else _LONG_DIGIT_RUN_STR
+        if pattern.search(content):
+            return json.loads(content)
+        return orjson.loads(content)
+
+elif JSON_BACKEND == "ujson":
+    _json_loads = ujson.loads
+else:
+    _json_loads = json.loads
+
+# Pre-built keyword argument dicts for the ujson/stdlib encode path, indexed by
+# (compact, sort_keys), so no per-call dict is allocated.
+_COMPACT_SEPARATORS = (",", ":")
+_ENCODE_KWARGS = {
+    (False, False): {},
+    (False, True): {"sort_keys": True},
+    (True, False): {"separators": _COMPACT_SEPARATORS},
+    (True, True): {"separators": _COMPACT_SEPARATORS, "sort_keys": True},
+}
+
+
 @overload
 def json_encode(
     obj: ArgJsonData,
@@ -113,14 +181,23 @@ def json_encode(
     compact: bool | None = None,
     indent: int | None = None,
 ) -> AnyStr:
-    kwargs = {}
     if indent is not None:
-        kwargs["indent"] = indent
-    if compact is not False and indent is None:
-        kwargs["separators"] = (",", ":")
-    if sort_keys is True:
-        kwargs["sort_keys"] = True
-    result = json.dumps(obj, default=default_json_serialization, **kwargs)
+        result = json.dumps(obj, default=default_json_serialization, indent=indent, sort_keys=sort_keys is True)
+        return result.encode("utf8") if binary is True else result
+    if JSON_BACKEND == "orjson":
+        option = _orjson_sorted_option if sort_keys is True else _orjson_base_option
+        try:
+            encoded = orjson.dumps(obj, default=default_json_serialization, option=option)
+        except TypeError:
+            # orjson refuses to serialize integers outside the 64-bit range,
+            # the stdlib codec serializes them exactly.
+            kwargs = _ENCODE_KWARGS[(compact is not False, sort_keys is True)]
+            result = json.dumps(obj, default=default_json_serialization, **kwargs)
+            return result.encode("utf8") if binary is True else result
+        return encoded if binary is True else encoded.decode("utf8")
+    kwargs = _ENCODE_KWARGS[(compact is not False, sort_keys is True)]
+    dumps = ujson.dumps if JSON_BACKEND == "ujson" else json.dumps
+    result = dumps(obj, default=default_json_serialization, **kwargs)
     return result.encode("utf8") if binary is True else result
 
 
@@ -128,24 +205,41 @@ T = TypeVar("T")
 
 
 @overload
-def json_decode(content: AnyStr | IO[AnyStr]) -> JsonData:
+def json_decode(content: AnyStr) -> JsonData:
     ...
 
 
 @overload
-def json_decode(content: AnyStr | IO[AnyStr], assume_type: type[T]) -> T:
+def json_decode(content: AnyStr, assume_type: type[T]) -> T:
     ...
 
 
 def json_decode(
-    content: AnyStr | IO[AnyStr],
+    content: AnyStr,
     # This argument is only used to pass onto cast() via a type var, it has no runtime
     # usage.
     assume_type: type[T] | None = None,  # pylint: disable=unused-argument
 ) -> JsonData | T:
-    if isinstance(content, (str, bytes)):
-        return cast("T | None", json.loads(content))
-    return cast("T | None", json.load(content))
+    # All backends accept both `str` and `bytes` natively, so no type check is
+    # needed on this hot path. File-like inputs go through `json_decode_stream`.
+    return cast("T | None", _json_loads(content))
+
+
+@overload
+def json_decode_stream(content: IO[AnyStr]) -> JsonData:
+    ...
+
+
+@overload
+def json_decode_stream(content: IO[AnyStr], assume_type: type[T]) -> T:
+    ...
+
+
+def json_decode_stream(
+    content: IO[AnyStr],
+    assume_type: type[T] | None = None,  # pylint: disable=unused-argument
+) -> JsonData | T:
+    return cast("T | None", _json_loads(content.read()))
 
 
 def assert_never(value: NoReturn) -> NoReturn:
@@ -158,21 +252,25 @@ class Timeout(Exception):
 
 @dataclass(frozen=True)
 class Expiration:
+    # Manual __slots__ since dataclass(slots=True) needs Python 3.10 and 3.8
+    # is still supported.
+    __slots__ = ("start_time", "deadline")
+
     start_time: float
     deadline: float
 
     @classmethod
     def from_timeout(cls, timeout: float) -> Expiration:
-        start_time = time.monotonic()
+        start_time = _monotonic()
         deadline = start_time + timeout
         return cls(start_time, deadline)
 
     @property
     def elapsed(self) -> float:
-        return time.monotonic() - self.start_time
+        return _monotonic() - self.start_time
 
     def is_expired(self) -> bool:
-        return time.monotonic() > self.deadline
+        return _monotonic() > self.deadline
 
     def raise_timeout_if_expired(self, msg_format: str, *args: object, **kwargs: object) -> None:
         """Raise `Timeout` if this object is expired.
@@ -195,37 +293,58 @@ class Expiration:
 
 
 def convert_to_int(object_: dict, key: str, content_type: str) -> None:
-    if object_.get(key) is None:
+    try:
+        value = object_[key]
+    except KeyError:
+        return
+    if value is None:
         return
     try:
-        object_[key] = int(object_[key])
-    except ValueError:
+        object_[key] = int(value)
+    except (ValueError, TypeError):
+        # Imported here instead of at module scope to avoid a circular import,
+        # only reached on the error path.
         from karapace.rapu import http_error
 
         http_error(
-            message=f"{key} is not a valid int: {object_[key]}",
+            message=f"{key} is not a valid int: {value}",
             content_type=content_type,
-            code=HTTPStatus.INTERNAL_SERVER_ERROR,
+            code=_HTTP_INTERNAL_SERVER_ERROR,
         )
 
 
 class KarapaceKafkaClient(KafkaClient):
     def __init__(self, **configs):
         kafka.client_async.BrokerConnection = KarapaceBrokerConnection
+        # Node ids whose connection disconnected with a DNS failure since the
+        # last `close_invalid_connections` call. Acts as a dirty flag so the
+        # per-poll scan is O(1) when no connection has failed, which is the
+        # common case. Set up before `super().__init__` since bootstrapping may
+        # already trigger connection state changes.
+        self._dns_failed_nodes = set()
         super().__init__(**configs)
 
+    def _conn_state_change(self, node_id, sock, conn):
+        super()._conn_state_change(node_id, sock, conn)
+        if conn.disconnected() and conn.ns_blackout():
+            self._dns_failed_nodes.add(node_id)
+
     def close_invalid_connections(self):
-        update_needed = False
+        if not self._dns_failed_nodes:
+            return
+        # Only filter under the lock, closing happens outside to keep the
+        # critical section short. `close` re-acquires the lock itself.
+        invalid_nodes = []
         with self._lock:
-            conns = self._conns.copy().values()
-            for conn in conns:
+            for node_id in list(self._dns_failed_nodes):
+                self._dns_failed_nodes.discard(node_id)
+                conn = self._conns.get(node_id)
                 if conn and conn.ns_blackout():
-                    LOG.info(
-                        "Node id %s no longer in cluster metadata, closing connection and requesting update", conn.node_id
-                    )
-                    self.close(conn.node_id)
-                    update_needed = True
-        if update_needed:
+                    invalid_nodes.append(node_id)
+        for node_id in invalid_nodes:
+            LOG.info("Node id %s no longer in cluster metadata, closing connection and requesting update", node_id)
+            self.close(node_id)
+        if invalid_nodes:
             self.cluster.request_update()
 
     def _poll(self, timeout):
@@ -240,15 +359,20 @@ class KarapaceBrokerConnection(BrokerConnection):
     def __init__(self, host, port, afi, **configs):
         super().__init__(host, port, afi, **configs)
         self.error = None
-        self.fail_time = time.monotonic()
+        self.fail_time = _monotonic()
+        self._is_dns_failure = False
 
     def close(self, error=None):
         self.error = error
-        self.fail_time = time.monotonic()
+        self.fail_time = _monotonic()
+        # Classify once on error transition, `ns_blackout` is called for every
+        # connection on every poll and stringifying the error each time is
+        # expensive.
+        self._is_dns_failure = error is not None and "DNS failure" in str(error)
         super().close(error)
 
     def ns_blackout(self):
-        return "DNS failure" in str(self.error) and self.fail_time + NS_BLACKOUT_DURATION_SECONDS > time.monotonic()
+        return self._is_dns_failure and self.fail_time + NS_BLACKOUT_DURATION_SECONDS > _monotonic()
 
     def blacked_out(self):
         return self.ns_blackout() or super().blacked_out()
@@ -266,11 +390,15 @@ class DebugAccessLogger(AccessLogger):
         response: StreamResponse,
         time: float,  # pylint: disable=redefined-outer-name
     ) -> None:
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            # Avoid per-request formatting and allocations when access logs
+            # are not emitted, which is the common production configuration.
+            return
         try:
             fmt_info = self._format_line(request, response, time)
 
-            values = list()
-            extra = dict()
+            values = []
+            extra = {}
             for key, value in fmt_info:
                 values.append(value)
 
@@ -278,9 +406,7 @@ class DebugAccessLogger(AccessLogger):
                     extra[key] = value
                 else:
                     k1, k2 = key
-                    dct = extra.get(k1, {})
-                    dct[k2] = value
-                    extra[k1] = dct
+                    extra.setdefault(k1, {})[k2] = value
 
             self.logger.debug(self._log_format % tuple(values), extra=extra)
         except Exception:  # pylint: disable=broad-except
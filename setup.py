@@ -35,6 +35,7 @@ setup(
     extras_require={
         # compression algorithms supported by KafkaConsumer
         "lz4": ["lz4"],
+        "orjson": ["orjson"],
         "sentry-sdk": ["sentry-sdk>=1.6.0"],
         # compression algorithms supported by AioKafka and KafkaConsumer
         "snappy": ["python-snappy"],
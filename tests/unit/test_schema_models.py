@@ -0,0 +1,33 @@
+"""
+Copyright (c) 2023 Aiven Ltd
+See LICENSE for details
+"""
+from karapace.schema_models import SchemaType, TypedSchema
+from karapace.utils import json_decode, JSON_BACKEND
+
+
+def test_normalize_schema_str_sorts_and_compacts() -> None:
+    schema_str = '{"type": "record", "name": "r", "fields": []}'
+    normalized = TypedSchema.normalize_schema_str(schema_str, SchemaType.AVRO)
+    assert normalized == '{"fields":[],"name":"r","type":"record"}'
+
+
+def test_normalize_schema_str_large_integer() -> None:
+    # Integer literals outside the 64-bit range must survive normalization
+    # byte-for-byte, bounds like a uint128 `maximum` would otherwise be
+    # silently rounded to a float.
+    schema_str = '{"maximum": 18446744073709551617}'
+    normalized = TypedSchema.normalize_schema_str(schema_str, SchemaType.JSONSCHEMA)
+    assert normalized == '{"maximum":18446744073709551617}'
+
+
+def test_normalize_schema_str_non_ascii() -> None:
+    # The orjson backend emits non-ASCII text as raw UTF-8, ujson and the
+    # stdlib escape it. Both normalizations decode back to the same data.
+    schema_str = '{"type": "record", "name": "r", "doc": "café", "fields": []}'
+    normalized = TypedSchema.normalize_schema_str(schema_str, SchemaType.AVRO)
+    if JSON_BACKEND == "orjson":
+        assert '"doc":"café"' in normalized
+    else:
+        assert '"doc":"caf\\u00e9"' in normalized
+    assert json_decode(normalized)["doc"] == "café"
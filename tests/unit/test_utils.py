@@ -0,0 +1,52 @@
+"""
+Copyright (c) 2023 Aiven Ltd
+See LICENSE for details
+"""
+from datetime import datetime, timedelta, timezone
+from karapace.utils import json_decode, json_encode
+
+
+def test_json_encode_datetime_naive_assumes_utc() -> None:
+    # Naive datetimes are assumed to be UTC and always carry the Z designator,
+    # regardless of which JSON backend was picked at import time.
+    assert json_encode(datetime(2023, 1, 2, 3, 4, 5)) == '"2023-01-02T03:04:05Z"'
+
+
+def test_json_encode_datetime_utc_uses_z_designator() -> None:
+    assert json_encode(datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone.utc)) == '"2023-01-02T03:04:05Z"'
+
+
+def test_json_encode_datetime_with_offset() -> None:
+    # The stdlib and ujson backends convert to UTC with the Z designator, the
+    # orjson backend serializes natively and keeps the original offset. Both
+    # are valid ISO 8601 renderings of the same instant.
+    encoded = json_encode(datetime(2023, 1, 2, 3, 4, 5, tzinfo=timezone(timedelta(hours=2))))
+    assert encoded in ('"2023-01-02T01:04:05Z"', '"2023-01-02T03:04:05+02:00"')
+
+
+def test_json_encode_timedelta_total_seconds() -> None:
+    assert json_encode(timedelta(seconds=90)) == "90.0"
+
+
+def test_json_encode_compact_sorted_roundtrip() -> None:
+    data = {"b": 1, "a": [1, 2], "c": None}
+    encoded = json_encode(data, compact=True, sort_keys=True)
+    assert encoded == '{"a":[1,2],"b":1,"c":null}'
+    assert json_decode(encoded) == data
+
+
+def test_json_decode_large_integer_fidelity() -> None:
+    # orjson alone parses integer literals outside the 64-bit range as lossy
+    # floats; the decode path falls back to the stdlib codec for such inputs.
+    huge = 18446744073709551617
+    assert json_decode('{"maximum": 18446744073709551617}') == {"maximum": huge}
+    assert json_decode(b'{"maximum": 18446744073709551617}') == {"maximum": huge}
+
+
+def test_json_encode_large_integer_fidelity() -> None:
+    assert json_encode({"maximum": 18446744073709551617}, compact=True) == '{"maximum":18446744073709551617}'
+
+
+def test_json_encode_binary_matches_text() -> None:
+    data = {"key": "value"}
+    assert json_encode(data, binary=True) == json_encode(data).encode("utf8")